@@ -17,12 +17,746 @@ import sys
 import argparse
 import requests
 import hashlib
+import json
+import mmap
+import operator
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 from pathlib import Path
-from huggingface_hub import list_repo_tree
+from types import SimpleNamespace
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from huggingface_hub import list_repo_tree, repo_info
 
 
-def download_hf_repo(repo_id, base_path=None, force_redownload=False, force_files=None):
+def _mount_adapter(session, pool_maxsize):
+    """Mount an HTTPS adapter keeping up to pool_maxsize connections per host, closing the previous one."""
+    previous = session.adapters.get("https://")
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=5, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    ))
+    if previous is not None:
+        previous.close()
+
+
+def _create_session():
+    """Create a shared HTTP session that reuses connections across requests."""
+    session = requests.Session()
+    _mount_adapter(session, 64)
+    session.headers.update({"User-Agent": "download-hf-repo"})
+    return session
+
+
+# Module-level session so keep-alive connections to huggingface.co and the CDN are reused
+SESSION = _create_session()
+
+# Hidden directory inside the download path holding ETags, download records and the listing index
+METADATA_DIR = ".hf_download"
+
+# Size of the chunks streamed from the network and written to disk
+CHUNK_SIZE = 1024 * 1024
+
+# Number of chunks submitted per vectored write (writev/pwritev) syscall
+WRITE_BATCH = 4
+
+# Files larger than this are fetched as parallel byte ranges
+RANGED_DOWNLOAD_THRESHOLD = 100 * 1024 * 1024
+RANGED_DOWNLOAD_PARTS = 6
+
+# Small files get their own, wider worker pool so they are not queued behind large shards
+SMALL_FILE_THRESHOLD = 10 * 1024 * 1024
+# The small-file pool is --jobs times this factor, capped at SMALL_FILE_WORKERS
+SMALL_FILE_WORKERS = 32
+SMALL_FILE_JOBS_FACTOR = 4
+
+
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+def format_size(size_bytes):
+    """Convert bytes to human readable format"""
+    if size_bytes is None:
+        return "N/A"
+    # Each unit is 2**10 times the previous one, so the bit length selects the unit directly
+    unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(SIZE_UNITS) - 1) if size_bytes >= 1 else 0
+    return f"{size_bytes / (1 << (10 * unit_index)):.1f} {SIZE_UNITS[unit_index]}"
+
+
+class _StatusLog:
+    """
+    Thread-safe status line buffer that writes lines in batches through tqdm.write.
+    
+    Batching turns thousands of per-file status lines into a few writes (and progress bar
+    redraws); lines written with flush=True are emitted immediately, after any pending ones.
+    """
+    
+    def __init__(self, batch_size=50):
+        self._batch_size = batch_size
+        self._lines = []
+        self._lock = threading.Lock()
+    
+    def write(self, line, flush=False):
+        with self._lock:
+            self._lines.append(line)
+            if flush or len(self._lines) >= self._batch_size:
+                self._flush()
+    
+    def flush(self):
+        with self._lock:
+            self._flush()
+    
+    def _flush(self):
+        if self._lines:
+            tqdm.write("\n".join(self._lines))
+            self._lines.clear()
+
+
+def _etag_path(download_path, file_path):
+    """Return the path of the ETag sidecar for a repository file."""
+    return download_path / METADATA_DIR / f"{file_path}.etag"
+
+
+def _read_etag(download_path, file_path):
+    """Return the cached ETag for a repository file, or None if there is none."""
+    try:
+        return _etag_path(download_path, file_path).read_text().strip() or None
+    except OSError:
+        return None
+
+
+def _write_etag(download_path, file_path, etag):
+    """Cache the ETag for a repository file; a falsy etag removes the cached value."""
+    etag_path = _etag_path(download_path, file_path)
+    if etag:
+        etag_path.parent.mkdir(parents=True, exist_ok=True)
+        etag_path.write_text(etag)
+    elif etag_path.exists():
+        etag_path.unlink()
+
+
+class DownloadCancelled(Exception):
+    """Raised in download workers when the download has been cancelled (e.g. by Ctrl-C)."""
+
+
+def _http_get(session, url, headers=None):
+    """Issue a streaming GET request through the shared connection pool."""
+    return session.get(url, stream=True, headers=headers)
+
+
+def _iter_chunks(response, *cancel_events):
+    """
+    Yield CHUNK_SIZE pieces of a streaming response body.
+    
+    Reads straight from the underlying urllib3 response, skipping the per-chunk
+    generator layers of requests' iter_content. Raises DownloadCancelled as soon as
+    one of the given threading.Events is set.
+    """
+    for chunk in response.raw.stream(CHUNK_SIZE, decode_content=True):
+        if any(event.is_set() for event in cancel_events):
+            raise DownloadCancelled()
+        if chunk:
+            yield chunk
+
+
+def _write_all(fd, data, offset=None):
+    """Write all of data to a raw file descriptor, at offset if given, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        if offset is None:
+            written = os.write(fd, view)
+        else:
+            written = os.pwrite(fd, view, offset)
+            offset += written
+        view = view[written:]
+
+
+def _write_chunks(fd, chunks, offset=None, progress=None):
+    """
+    Write an iterable of chunks to a raw file descriptor, at offset if given.
+    
+    Chunks are collected into batches of WRITE_BATCH and submitted with a single
+    writev/pwritev syscall where the platform provides them.
+    
+    Returns:
+        int: Total number of bytes written
+    """
+    vectored = getattr(os, 'writev' if offset is None else 'pwritev', None)
+    total_written = 0
+    batch = []
+    
+    def flush():
+        nonlocal total_written
+        batch_size = sum(len(chunk) for chunk in batch)
+        position = None if offset is None else offset + total_written
+        written = 0
+        if vectored is not None:
+            written = vectored(fd, batch) if offset is None else vectored(fd, batch, position)
+        if written < batch_size:
+            # Short or non-vectored write: write the remainder the plain way
+            _write_all(fd, memoryview(b"".join(batch))[written:], None if position is None else position + written)
+        total_written += batch_size
+        batch.clear()
+        if progress:
+            progress(batch_size)
+    
+    try:
+        for chunk in chunks:
+            batch.append(chunk)
+            if len(batch) >= WRITE_BATCH:
+                flush()
+    finally:
+        # Also write what was received when the stream stops early, so it can be resumed
+        if batch:
+            flush()
+    return total_written
+
+
+def _meta_path(download_path, file_path):
+    """Return the path of the download metadata sidecar for a repository file."""
+    return download_path / METADATA_DIR / f"{file_path}.meta"
+
+
+def _read_meta(meta_path):
+    """Return the download metadata stored in a sidecar, or None if there is none."""
+    try:
+        return json.loads(meta_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(meta_path, local_file_path, sha256=None):
+    """
+    Record the checksum, size and modification time of a complete local file.
+    
+    A later integrity check can trust the file without re-hashing it as long as its
+    size and mtime still match this record.
+    """
+    local_stat = local_file_path.stat()
+    meta = {
+        'sha256': sha256,
+        'size': local_stat.st_size,
+        'mtime': local_stat.st_mtime_ns,
+        'downloaded_at': time.time()
+    }
+    meta_path.parent.mkdir(parents=True, exist_ok=True)
+    meta_path.write_text(json.dumps(meta))
+
+
+def _preallocate(fd, size):
+    """
+    Reserve disk space for a file of the given size up front.
+    
+    posix_fallocate allocates the extents in one go so the following writes land in
+    contiguous, already allocated blocks. Platforms or filesystems without support
+    fall back to ftruncate, which only sets the file size.
+    """
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError:
+            pass  # e.g. EOPNOTSUPP on filesystems without fallocate support
+    os.ftruncate(fd, size)
+
+
+def _supports_ranges(session, file_url):
+    """Check whether the (redirected) file URL accepts byte range requests."""
+    try:
+        head_response = session.head(file_url, allow_redirects=True, timeout=10)
+        return head_response.status_code == 200 and head_response.headers.get('accept-ranges') == 'bytes'
+    except Exception:
+        return False
+
+
+def _download_ranged(session, file_url, local_file_path, file_size, progress=None, parts=RANGED_DOWNLOAD_PARTS, cancel=None):
+    """
+    Download a file as concurrent byte ranges written in place at their offsets.
+    
+    The data is written to a temporary `.incomplete` file which is renamed once all
+    ranges have finished, so an interrupted ranged download is never mistaken for a
+    complete file of the right size. Setting the cancel event stops all ranges, and
+    the first failing range stops the others.
+    
+    Returns:
+        str: The ETag reported by the server, if any
+    """
+    stop = threading.Event()
+    cancel_events = (stop, cancel) if cancel is not None else (stop,)
+    temp_path = local_file_path.with_name(local_file_path.name + ".incomplete")
+    part_size = -(-file_size // parts)  # ceil division
+    ranges = [(start, min(start + part_size, file_size) - 1) for start in range(0, file_size, part_size)]
+    
+    def fetch_range(start, end):
+        with _http_get(session, file_url, headers={'Range': f'bytes={start}-{end}'}) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise IOError(f"Server ignored range request for bytes {start}-{end}")
+            written = _write_chunks(fd, _iter_chunks(response, *cancel_events), start, progress)
+            if written != end - start + 1:
+                raise IOError(f"Incomplete range {start}-{end}: got {written} bytes")
+            return response.headers.get('ETag')
+    
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        try:
+            _preallocate(fd, file_size)
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [executor.submit(fetch_range, start, end) for start, end in ranges]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    # Stop the remaining ranges instead of letting them run to completion
+                    stop.set()
+                    for future in futures:
+                        future.cancel()
+                    raise
+                etags = [future.result() for future in futures]
+        finally:
+            os.close(fd)
+        os.replace(temp_path, local_file_path)
+        return etags[0]
+    except BaseException:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
+
+
+def _download_one(session, item, download_path, base_url, force_redownload, force_files, progress=None, label="Downloading", log=None, cancel=None):
+    """
+    Download a single repository file, resuming or skipping it when possible.
+    
+    Args:
+        session (requests.Session): Session used for all HTTP requests.
+        item: Repository tree entry with `path` and optional `size` attributes.
+        download_path (Path): Local repository root.
+        base_url (str): Base URL used to resolve file downloads.
+        force_redownload (bool): If True, re-download the file even if it already exists.
+        force_files (list): List of specific files to force re-download.
+        progress (callable, optional): Called with the number of bytes written for each chunk.
+        label (str): Prefix for status messages.
+        log (_StatusLog, optional): Shared status log; skip messages are batched, others flushed.
+        cancel (threading.Event, optional): When set, the transfer stops and DownloadCancelled
+            is raised; partial files are kept so the next run can resume them.
+    
+    Returns:
+        tuple: (file_path, ok, error) where error is None on success
+    """
+    if log is None:
+        log = _StatusLog(batch_size=1)
+    cancel_events = (cancel,) if cancel is not None else ()
+    if cancel is not None and cancel.is_set():
+        raise DownloadCancelled()
+    file_path = item.path
+    file_size = getattr(item, 'size', None)
+    local_file_path = download_path / file_path
+    file_url = f"{base_url}/{file_path}"
+    response = None
+    
+    try:
+        local_file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Check if file already exists and is complete
+        force_this_file = force_redownload or (force_files and file_path in force_files)
+        if local_file_path.exists() and not force_this_file:
+            # Verify file integrity
+            local_size = local_file_path.stat().st_size
+            expected_size = file_size
+            
+            # If we have expected size info, check if sizes match
+            if expected_size is not None:
+                if local_size == expected_size:
+                    log.write(f"{label}: Skipping {file_path} (already complete)")
+                    return file_path, True, None
+                elif local_size < expected_size:
+                    # File exists but is incomplete - try to resume
+                    log.write(f"{label}: Resuming {file_path} (from {format_size(local_size)}/{format_size(expected_size)})", flush=True)
+                    # Don't remove the file - we'll resume from this point
+                else:
+                    # Local file is larger than expected - corruption, restart
+                    log.write(f"{label}: Re-downloading {file_path} (corrupted: {local_size} > {expected_size})", flush=True)
+                    local_file_path.unlink()
+            elif (cached_etag := _read_etag(download_path, file_path)):
+                # No size info available, but a cached ETag lets the server decide with a conditional GET:
+                # 304 means the local file is current, 200 carries the new content in the same round trip
+                try:
+                    response = _http_get(session, file_url, headers={'If-None-Match': cached_etag})
+                    if response.status_code == 304:
+                        response.close()
+                        log.write(f"{label}: Skipping {file_path} (verified by ETag)")
+                        return file_path, True, None
+                    log.write(f"{label}: Re-downloading {file_path} (ETag changed)", flush=True)
+                    local_file_path.unlink()
+                except Exception:
+                    if response is not None:
+                        response.close()
+                        response = None
+                    log.write(f"{label}: Re-downloading {file_path} (verification failed)", flush=True)
+                    local_file_path.unlink()
+            else:
+                # No size info available, try to verify by making a HEAD request
+                try:
+                    head_response = session.head(file_url)
+                    if head_response.status_code == 200:
+                        remote_size = head_response.headers.get('content-length')
+                        if remote_size and int(remote_size) == local_size:
+                            _write_etag(download_path, file_path, head_response.headers.get('ETag'))
+                            log.write(f"{label}: Skipping {file_path} (verified by HEAD request)")
+                            return file_path, True, None
+                        else:
+                            log.write(f"{label}: Re-downloading {file_path} (HEAD verification failed)", flush=True)
+                            local_file_path.unlink()
+                    else:
+                        # HEAD request failed, assume file is incomplete
+                        log.write(f"{label}: Re-downloading {file_path} (HEAD request failed)", flush=True)
+                        local_file_path.unlink()
+                except Exception:
+                    # If HEAD request fails, assume file is incomplete
+                    log.write(f"{label}: Re-downloading {file_path} (verification failed)", flush=True)
+                    local_file_path.unlink()
+        elif force_this_file and local_file_path.exists():
+            # Forced re-downloads start from scratch instead of resuming past the end of the file
+            local_file_path.unlink()
+        
+        # Download file; any cached ETag and metadata are dropped until the new content is complete
+        _write_etag(download_path, file_path, None)
+        meta_path = _meta_path(download_path, file_path)
+        if meta_path.exists():
+            meta_path.unlink()
+        
+        # Large fresh downloads are split into byte ranges fetched over parallel connections
+        if (file_size and file_size > RANGED_DOWNLOAD_THRESHOLD and hasattr(os, 'pwrite')
+                and not local_file_path.exists() and _supports_ranges(session, file_url)):
+            log.write(f"{label}: Downloading {file_path} ({format_size(file_size)}, {RANGED_DOWNLOAD_PARTS} connections)", flush=True)
+            etag = _download_ranged(session, file_url, local_file_path, file_size, progress, cancel=cancel)
+            _write_etag(download_path, file_path, etag)
+            _write_meta(meta_path, local_file_path, _lfs_sha256(item))
+            return file_path, True, None
+        
+        # Check if we need to resume or start fresh
+        resume_from = 0
+        if local_file_path.exists():
+            resume_from = local_file_path.stat().st_size
+        
+        # Set up headers for resuming if needed
+        headers = {}
+        if resume_from > 0:
+            headers['Range'] = f'bytes={resume_from}-'
+        
+        if response is None:
+            response = _http_get(session, file_url, headers=headers)
+        
+        try:
+            response.raise_for_status()
+            
+            # Check if server supports range requests
+            if resume_from > 0 and response.status_code != 206:
+                # Server doesn't support ranges, restart download
+                log.write(f"{label}: Server doesn't support resume, restarting {file_path}", flush=True)
+                local_file_path.unlink()
+                resume_from = 0
+                # Retry without range header
+                response.close()
+                response = _http_get(session, file_url)
+                response.raise_for_status()
+            
+            # Calculate remaining bytes to download
+            remaining_bytes = file_size - resume_from if file_size else None
+            
+            if resume_from > 0:
+                log.write(f"{label}: Resuming {file_path} from {format_size(resume_from)} ({format_size(remaining_bytes)} remaining)", flush=True)
+            else:
+                log.write(f"{label}: Downloading {file_path} ({format_size(file_size)})", flush=True)
+            
+            # Write through a raw descriptor to skip Python's buffered I/O layer; append when resuming
+            flags = os.O_WRONLY | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+            flags |= os.O_APPEND if resume_from > 0 else os.O_TRUNC
+            fd = os.open(local_file_path, flags, 0o644)
+            try:
+                _write_chunks(fd, _iter_chunks(response, *cancel_events), progress=progress)
+            finally:
+                os.close(fd)
+            
+            _write_etag(download_path, file_path, response.headers.get('ETag'))
+            if file_size is None or local_file_path.stat().st_size == file_size:
+                _write_meta(meta_path, local_file_path, _lfs_sha256(item))
+        finally:
+            response.close()
+        
+        return file_path, True, None
+        
+    except DownloadCancelled:
+        # Keep the partial file so the next run resumes it
+        if response is not None:
+            response.close()
+        raise
+    except Exception as e:
+        if response is not None:
+            response.close()
+        log.write(f"{label}: Failed: {file_path} - {e}", flush=True)
+        # Clean up partial file
+        if local_file_path.exists():
+            local_file_path.unlink()
+        return file_path, False, str(e)
+
+
+def _download_with_hf_transfer(repo_id, download_path, force_redownload, force_files, jobs):
+    """
+    Download a repository with huggingface_hub's snapshot_download using the hf_transfer backend.
+    
+    Returns:
+        bool: True if the download ran, False if hf_transfer is not available or not supported
+    """
+    import huggingface_hub
+    
+    # huggingface_hub 1.0 dropped hf_transfer and ignores HF_HUB_ENABLE_HF_TRANSFER
+    if int(huggingface_hub.__version__.split(".")[0]) >= 1:
+        print(f"⚠️  hf_transfer is not supported by huggingface_hub {huggingface_hub.__version__} (requires <1.0), using built-in downloader")
+        return False
+    
+    try:
+        import hf_transfer  # noqa: F401
+    except ImportError:
+        print("⚠️  hf_transfer is not installed (pip install hf_transfer), using built-in downloader")
+        return False
+    
+    from huggingface_hub import constants, snapshot_download
+    
+    # huggingface_hub reads this setting at import time, so set both the env var and the constant
+    os.environ["HF_HUB_ENABLE_HF_TRANSFER"] = "1"
+    constants.HF_HUB_ENABLE_HF_TRANSFER = True
+    
+    snapshot_download(
+        repo_id=repo_id,
+        local_dir=str(download_path),
+        max_workers=jobs,
+        force_download=force_redownload
+    )
+    if force_files and not force_redownload:
+        snapshot_download(
+            repo_id=repo_id,
+            local_dir=str(download_path),
+            max_workers=jobs,
+            force_download=True,
+            allow_patterns=force_files
+        )
+    return True
+
+
+def _stat_or_none(path):
+    """Return os.stat() of a path with a single syscall, or None if it does not exist."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _stat_all(paths, max_workers=16):
+    """
+    Stat many local paths concurrently.
+    
+    stat() releases the GIL, so a thread pool overlaps the syscall latency, which
+    matters on cold caches and network filesystems.
+    
+    Returns:
+        list: os.stat_result or None for each path, in input order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_stat_or_none, paths))
+
+
+def _list_repo_tree_cached(repo_id, download_path):
+    """
+    List all entries of a repository, reusing the index cached in the download path.
+    
+    A single repo_info call fetches the current commit; when it matches the commit of
+    the cached index, the (possibly paginated) tree listing is skipped entirely.
+    
+    Returns:
+        list: Tree entries with `path`, `size` and `lfs` attributes
+    """
+    commit_sha = repo_info(repo_id).sha
+    index_path = download_path / METADATA_DIR / "index.json"
+    
+    try:
+        index = json.loads(index_path.read_text())
+        if commit_sha and index.get('sha') == commit_sha:
+            return [
+                SimpleNamespace(
+                    path=entry['path'],
+                    size=entry['size'],
+                    lfs=SimpleNamespace(sha256=entry['lfs_sha256']) if entry['lfs_sha256'] else None
+                )
+                for entry in index['files']
+            ]
+    except (OSError, ValueError, KeyError):
+        pass  # No usable index, list the repository
+    
+    repo_tree = list(list_repo_tree(repo_id, revision=commit_sha, recursive=True))
+    
+    # Only persist the index for repositories that have a local copy
+    if commit_sha and download_path.exists():
+        index = {
+            'sha': commit_sha,
+            'files': [
+                {'path': item.path, 'size': getattr(item, 'size', None), 'lfs_sha256': _lfs_sha256(item)}
+                for item in repo_tree
+            ]
+        }
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        index_path.write_text(json.dumps(index))
+    
+    return repo_tree
+
+
+def _is_file(item, _get_type=operator.attrgetter('type')):
+    """Return True if a repository tree entry is a file rather than a directory."""
+    # Check if it's a file by looking for type or size attribute
+    try:
+        return _get_type(item) == 'file'
+    except AttributeError:
+        pass
+    if getattr(item, 'size', None) is not None:
+        # If it has a size and size is not None, it's likely a file
+        return True
+    # Fallback: assume it's a file if path doesn't end with / and doesn't look like a directory
+    path_str = str(item.path)
+    return not path_str.endswith('/') and '.' in os.path.basename(path_str)
+
+
+def _lfs_sha256(item):
+    """Return the LFS SHA256 of a repository tree entry, or None for non-LFS files."""
+    lfs = getattr(item, 'lfs', None)
+    return getattr(lfs, 'sha256', None) if lfs else None
+
+
+def _sha256_buffer(buffer, progress=None, block_size=64 * 1024 * 1024):
+    """
+    Compute the SHA256 hex digest of a bytes-like object such as an mmap.
+    
+    The buffer is hashed through zero-copy memoryview slices; the slicing only
+    exists to report progress between blocks.
+    """
+    sha256_hash = hashlib.sha256()
+    with memoryview(buffer) as view:
+        for start in range(0, len(view), block_size):
+            block = view[start:start + block_size]
+            sha256_hash.update(block)
+            if progress:
+                progress(len(block))
+    return sha256_hash.hexdigest()
+
+
+def _zero_byte_stats(mm, file_size, sample_size):
+    """
+    Analyse zero bytes in a memory-mapped file.
+    
+    The zero percentage is estimated from samples at the beginning, middle and end.
+    Trailing zeros are counted over the whole file by scanning backwards one sample
+    at a time until a non-zero byte is found, which normally touches only the tail.
+    
+    Returns:
+        tuple: (zero_percentage, trailing_zeros)
+    """
+    # Sample from beginning, middle, and end
+    samples = []
+    sample_positions = [0, file_size//2, max(0, file_size - sample_size)]
+    
+    for pos in sample_positions:
+        chunk = mm[pos:pos + sample_size]
+        if chunk:
+            samples.append(chunk)
+    
+    # Calculate zero percentage from samples
+    total_sampled_bytes = sum(len(sample) for sample in samples)
+    zero_bytes = sum(sample.count(0) for sample in samples)
+    zero_percentage = (zero_bytes / total_sampled_bytes * 100) if total_sampled_bytes > 0 else 0
+    
+    # Check for trailing zeros specifically (rstrip scans in C)
+    trailing_zeros = 0
+    end = file_size
+    while end > 0:
+        block = mm[max(0, end - sample_size):end]
+        stripped = len(block.rstrip(b'\x00'))
+        trailing_zeros += len(block) - stripped
+        if stripped:
+            break
+        end -= len(block)
+    
+    return zero_percentage, trailing_zeros
+
+
+def check_file_integrity(file_path, expected_sha256=None, sample_size=1024*1024, meta_path=None, deep_check=False):
+    """
+    Check file integrity using both checksum verification and zero byte analysis.
+    
+    If meta_path points to a download record whose expected checksum, size and mtime
+    still match, the file is reported as "Unchanged" without hashing, unless deep_check
+    is set. Such a file was never hashed locally, so this is not a checksum match. A
+    successful hash refreshes the record.
+    
+    Returns (integrity_status, details_str, suspicious)
+    """
+    try:
+        local_stat = file_path.stat()
+        file_size = local_stat.st_size
+        if file_size == 0:
+            return "Empty", "0 bytes", True
+        
+        # Unchanged since it was downloaded (or last verified): skip the O(file size) hash
+        meta = _read_meta(meta_path) if meta_path and not deep_check else None
+        if (meta and meta.get('sha256') == expected_sha256 and meta.get('size') == file_size
+                and meta.get('mtime') == local_stat.st_mtime_ns):
+            return "Unchanged", "not re-hashed", False
+        
+        # Map the file once; the checksum reads it in a single pass and the zero byte
+        # analysis only runs when there is no checksum or it failed (pages are still cached)
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Verify against the LFS checksum from the repository listing when available
+            if expected_sha256:
+                with tqdm(
+                    total=file_size,
+                    unit='B',
+                    unit_scale=True,
+                    desc="    Computing SHA256",
+                    leave=False,
+                    bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'
+                ) as hash_pbar:
+                    local_sha256 = _sha256_buffer(mm, hash_pbar.update)
+                
+                if local_sha256 == expected_sha256:
+                    if meta_path:
+                        _write_meta(meta_path, file_path, expected_sha256)
+                    return "Verified", f"SHA256 ✓", False
+            
+            zero_percentage, trailing_zeros = _zero_byte_stats(mm, file_size, sample_size)
+        
+        # Convert trailing zeros to MB
+        trailing_zeros_mb = trailing_zeros / (1024 * 1024)
+        
+        if expected_sha256:
+            return "Checksum Fail", f"SHA256 mismatch, {zero_percentage:.1f}% zeros, {trailing_zeros_mb:.1f}MB trailing", True
+        
+        # Flag as suspicious if:
+        # 1. More than 20% zeros (typical binary files have much less)
+        # 2. More than 10MB of trailing zeros
+        suspicious = zero_percentage > 20 or trailing_zeros_mb > 10
+        
+        if suspicious:
+            return "Suspicious", f"{zero_percentage:.1f}% zeros, {trailing_zeros_mb:.1f}MB trailing", True
+        else:
+            return "Size OK", f"{zero_percentage:.1f}% zeros", False
+        
+    except Exception as e:
+        return "Error", f"Check failed: {e}", False
+
+
+def download_hf_repo(repo_id, base_path=None, force_redownload=False, force_files=None, jobs=8, backend="requests"):
     """
     Download all files from a HuggingFace repository with progress tracking.
     
@@ -31,21 +765,15 @@ def download_hf_repo(repo_id, base_path=None, force_redownload=False, force_file
         base_path (str, optional): Base path for downloads. If None, uses HF_HOME environment variable.
         force_redownload (bool): If True, re-download all files even if they already exist.
         force_files (list): List of specific files to force re-download.
+        jobs (int): Number of files over 10 MB to download concurrently; smaller files
+            use up to SMALL_FILE_JOBS_FACTOR times as many workers.
+        backend (str): "requests" for the built-in downloader or "hf_transfer" to use
+            huggingface_hub's snapshot_download with the Rust-based hf_transfer backend.
     
     Returns:
         str: The local path where files were downloaded
     """
     
-    def format_size(size_bytes):
-        """Convert bytes to human readable format"""
-        if size_bytes is None:
-            return "N/A"
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
-    
     # Parse repo_id to get organization and model name
     if '/' not in repo_id:
         raise ValueError("repo_id must be in format 'organization/model-name'")
@@ -61,45 +789,49 @@ def download_hf_repo(repo_id, base_path=None, force_redownload=False, force_file
     
     print(f"Downloading {repo_id} to: {download_path}")
     
+    if backend == "hf_transfer":
+        if _download_with_hf_transfer(repo_id, download_path, force_redownload, force_files, jobs):
+            print(f"Files saved to: {download_path}")
+            return str(download_path)
+    
     # Get list of files with sizes using repo_tree
     try:
-        repo_tree = list_repo_tree(repo_id, recursive=True)
+        repo_tree = _list_repo_tree_cached(repo_id, download_path)
         # Filter only files (not directories) - use more robust filtering
+        # Paths and sizes are collected alongside the items so later passes avoid attribute lookups
         file_items = []
+        file_paths = []
+        file_sizes = []
         for item in repo_tree:
-            # Check if it's a file by looking for size attribute or type
-            is_file = False
-            if hasattr(item, 'type'):
-                is_file = item.type == 'file'
-            elif hasattr(item, 'size') and getattr(item, 'size', None) is not None:
-                # If it has a size and size is not None, it's likely a file
-                is_file = True
-            else:
-                # Fallback: assume it's a file if path doesn't end with / and doesn't look like a directory
-                path_str = str(item.path)
-                is_file = not path_str.endswith('/') and '.' in path_str.split('/')[-1]
-            
-            if is_file:
+            if _is_file(item):
                 file_items.append(item)
+                file_paths.append(item.path)
+                file_sizes.append(getattr(item, 'size', None))
         
-        total_size = sum(getattr(item, 'size', 0) or 0 for item in file_items)
+        total_size = sum(size or 0 for size in file_sizes)
         print(f"Found {len(file_items)} files to download ({format_size(total_size)} total)")
         
-        # Quick preview of what needs to be downloaded
+        # Quick preview of what needs to be downloaded (one stat() call per file, run concurrently)
         missing_files = []
         incomplete_files = []
-        for item in file_items:
-            local_file_path = download_path / item.path
-            expected_size = getattr(item, 'size', None)
+        local_stats = _stat_all([download_path / file_path for file_path in file_paths])
+        forced_files = set(force_files or ())
+        bar_total = 0  # Bytes the progress bar expects, including forced re-downloads
+        for file_path, expected_size, local_stat in zip(file_paths, file_sizes, local_stats):
+            if local_stat is None:
+                missing_files.append((file_path, expected_size))
+            elif expected_size is not None and local_stat.st_size != expected_size:
+                incomplete_files.append((file_path, local_stat.st_size, expected_size))
             
-            if not local_file_path.exists():
-                missing_files.append((item.path, expected_size))
-            elif expected_size is not None:
-                local_size = local_file_path.stat().st_size
-                if local_size != expected_size:
-                    incomplete_files.append((item.path, local_size, expected_size))
+            if expected_size is not None:
+                if (force_redownload or file_path in forced_files or local_stat is None
+                        or local_stat.st_size > expected_size):
+                    bar_total += expected_size
+                else:
+                    bar_total += expected_size - local_stat.st_size
         
         files_to_download = len(missing_files) + len(incomplete_files)
+        download_size = 0
         if files_to_download == 0:
             print("✅ All files already exist with correct sizes!")
             if not force_redownload and not force_files:
@@ -124,138 +856,56 @@ def download_hf_repo(repo_id, base_path=None, force_redownload=False, force_file
     # Base URL for HuggingFace file downloads
     base_url = f"https://huggingface.co/{repo_id}/resolve/main"
     
-    # Download each file with progress tracking
+    # Download files concurrently with progress tracking
     failed_downloads = []
     successful_downloads = 0
     
-    # Process files with simple counter
-    for i, item in enumerate(file_items, 1):
-        file_path = item.path
-        file_size = getattr(item, 'size', None)
+    # Dispatch files to a pool of workers; progress is aggregated in a single bar
+    progress_lock = threading.Lock()
+    status_log = _StatusLog()
+    with tqdm(total=bar_total, unit='B', unit_scale=True, desc="Downloading") as pbar:
+        def report_progress(num_bytes):
+            with progress_lock:
+                pbar.update(num_bytes)
         
+        # Small files are latency-bound, so they run with more concurrency than the --jobs used for large files
+        jobs = max(1, jobs)
+        small_workers = min(SMALL_FILE_WORKERS, SMALL_FILE_JOBS_FACTOR * jobs)
+        # Every large-file worker may run RANGED_DOWNLOAD_PARTS streams at once; size the pool
+        # so none of those connections is discarded when it is returned
+        _mount_adapter(SESSION, jobs * RANGED_DOWNLOAD_PARTS + small_workers)
+        executor = ThreadPoolExecutor(max_workers=jobs)
+        small_executor = ThreadPoolExecutor(max_workers=small_workers)
+        cancel = threading.Event()
         try:
-            # Create local file path
-            local_file_path = download_path / file_path
-            local_file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Check if file already exists and is complete
-            force_this_file = force_redownload or (force_files and file_path in force_files)
-            if local_file_path.exists() and not force_this_file:
-                # Verify file integrity
-                local_size = local_file_path.stat().st_size
-                expected_size = file_size
-                
-                # If we have expected size info, check if sizes match
-                if expected_size is not None:
-                    if local_size == expected_size:
-                        print(f"Downloading files {i}/{len(file_items)}: Skipping {file_path} (already complete)")
-                        successful_downloads += 1
-                        continue
-                    elif local_size < expected_size:
-                        # File exists but is incomplete - try to resume
-                        print(f"Downloading files {i}/{len(file_items)}: Resuming {file_path} (from {format_size(local_size)}/{format_size(expected_size)})")
-                        # Don't remove the file - we'll resume from this point
-                    else:
-                        # Local file is larger than expected - corruption, restart
-                        print(f"Downloading files {i}/{len(file_items)}: Re-downloading {file_path} (corrupted: {local_size} > {expected_size})")
-                        local_file_path.unlink()
-                else:
-                    # No size info available, try to verify by making a HEAD request
-                    try:
-                        file_url = f"{base_url}/{file_path}"
-                        head_response = requests.head(file_url)
-                        if head_response.status_code == 200:
-                            remote_size = head_response.headers.get('content-length')
-                            if remote_size and int(remote_size) == local_size:
-                                print(f"Downloading files {i}/{len(file_items)}: Skipping {file_path} (verified by HEAD request)")
-                                successful_downloads += 1
-                                continue
-                            else:
-                                print(f"Downloading files {i}/{len(file_items)}: Re-downloading {file_path} (HEAD verification failed)")
-                                local_file_path.unlink()
-                        else:
-                            # HEAD request failed, assume file is incomplete
-                            print(f"Downloading files {i}/{len(file_items)}: Re-downloading {file_path} (HEAD request failed)")
-                            local_file_path.unlink()
-                    except Exception:
-                        # If HEAD request fails, assume file is incomplete
-                        print(f"Downloading files {i}/{len(file_items)}: Re-downloading {file_path} (verification failed)")
-                        local_file_path.unlink()
-            
-            # Download file
-            file_url = f"{base_url}/{file_path}"
-            
-            # Check if we need to resume or start fresh
-            resume_from = 0
-            file_mode = 'wb'
-            if local_file_path.exists():
-                resume_from = local_file_path.stat().st_size
-                file_mode = 'ab'  # Append mode for resuming
-            
-            # Set up headers for resuming if needed
-            headers = {}
-            if resume_from > 0:
-                headers['Range'] = f'bytes={resume_from}-'
-            
-            with requests.get(file_url, stream=True, headers=headers) as response:
-                response.raise_for_status()
-                
-                # Check if server supports range requests
-                if resume_from > 0 and response.status_code != 206:
-                    # Server doesn't support ranges, restart download
-                    print(f"Downloading files {i}/{len(file_items)}: Server doesn't support resume, restarting {file_path}")
-                    local_file_path.unlink()
-                    resume_from = 0
-                    file_mode = 'wb'
-                    # Retry without range header
-                    response.close()
-                    response = requests.get(file_url, stream=True)
-                    response.raise_for_status()
-                
-                # Calculate remaining bytes to download
-                remaining_bytes = file_size - resume_from if file_size else None
-                
-                # Show download progress
-                if resume_from > 0:
-                    print(f"Downloading files {i}/{len(file_items)}: Resuming {file_path} from {format_size(resume_from)} ({format_size(remaining_bytes)} remaining)")
+            # Largest files first (ties by path) so long transfers start early and small ones backfill
+            order = sorted(range(len(file_items)), key=lambda index: (-(file_sizes[index] or 0), file_paths[index]))
+            futures = []
+            for i, index in enumerate(order, 1):
+                item, file_size = file_items[index], file_sizes[index]
+                is_small = file_size is not None and file_size <= SMALL_FILE_THRESHOLD
+                futures.append((small_executor if is_small else executor).submit(
+                    _download_one, SESSION, item, download_path, base_url, force_redownload, force_files,
+                    progress=report_progress, label=f"Downloading files {i}/{len(file_items)}", log=status_log,
+                    cancel=cancel
+                ))
+            for future in as_completed(futures):
+                file_path, ok, err = future.result()
+                if ok:
+                    successful_downloads += 1
                 else:
-                    print(f"Downloading files {i}/{len(file_items)}: Downloading {file_path} ({format_size(file_size)})")
-                
-                with open(local_file_path, file_mode) as f:
-                    if file_size and file_size > 0:
-                        # For large files, show individual progress
-                        if file_size > 10 * 1024 * 1024:  # Files larger than 10MB
-                            with tqdm(
-                                total=file_size,  # Always show total file size
-                                unit='B',
-                                unit_scale=True,
-                                desc=f"  {file_path}",
-                                leave=False,
-                                initial=resume_from  # Start progress bar from current position
-                            ) as file_pbar:
-                                for chunk in response.iter_content(chunk_size=8192):
-                                    if chunk:
-                                        f.write(chunk)
-                                        file_pbar.update(len(chunk))
-                        else:
-                            # For smaller files, download without individual progress
-                            for chunk in response.iter_content(chunk_size=8192):
-                                if chunk:
-                                    f.write(chunk)
-                    else:
-                        # No size info, download without progress
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                
-                successful_downloads += 1
-                
-        except Exception as e:
-            print(f"Downloading files {i}/{len(file_items)}: Failed: {file_path} - {e}")
-            failed_downloads.append(file_path)
-            # Clean up partial file
-            if local_file_path.exists():
-                local_file_path.unlink()
+                    failed_downloads.append(file_path)
+        except BaseException:
+            # Ctrl-C or an unexpected error: drop queued files and stop in-flight transfers
+            cancel.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            small_executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        else:
+            executor.shutdown()
+            small_executor.shutdown()
+        finally:
+            status_log.flush()
     
     # Summary
     print(f"\nDownload completed!")
@@ -270,128 +920,16 @@ def download_hf_repo(repo_id, base_path=None, force_redownload=False, force_file
     return str(download_path)
 
 
-def check_repository_status(repo_id, base_path=None):
+def check_repository_status(repo_id, base_path=None, deep_check=False):
     """
     Check repository status and file integrity without downloading.
     
     Args:
         repo_id (str): The repository ID (e.g., "mlx-community/Qwen3-Embedding-0.6B-8bit")
         base_path (str, optional): Base path for downloads. If None, uses HF_HOME environment variable.
+        deep_check (bool): If True, hash every large file even if it is unchanged since download.
     """
     
-    def format_size(size_bytes):
-        """Convert bytes to human readable format"""
-        if size_bytes is None:
-            return "N/A"
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
-    
-    def check_file_integrity(file_path, repo_id, file_relative_path, sample_size=1024*1024):
-        """
-        Check file integrity using both checksum verification and zero byte analysis.
-        Returns (integrity_status, details_str, suspicious)
-        """
-        try:
-            file_size = file_path.stat().st_size
-            if file_size == 0:
-                return "Empty", "0 bytes", True
-            
-            # First try to get checksum from HuggingFace
-            try:
-                # Get LFS metadata from HuggingFace raw URL
-                raw_url = f"https://huggingface.co/{repo_id}/raw/main/{file_relative_path}"
-                response = requests.get(raw_url, timeout=10)
-                
-                if response.status_code == 200 and "oid sha256:" in response.text:
-                    # Parse LFS metadata
-                    lines = response.text.strip().split('\n')
-                    expected_sha256 = None
-                    expected_size = None
-                    
-                    for line in lines:
-                        if line.startswith("oid sha256:"):
-                            expected_sha256 = line.split(":", 1)[1]
-                        elif line.startswith("size "):
-                            expected_size = int(line.split(" ", 1)[1])
-                    
-                    if expected_sha256 and expected_size:
-                        # Verify size first (quick check)
-                        if file_size != expected_size:
-                            return "Size Mismatch", f"{file_size} vs {expected_size} bytes", True
-                        
-                        # Calculate SHA256 of local file
-                        sha256_hash = hashlib.sha256()
-                        
-                        with open(file_path, 'rb') as f:
-                            with tqdm(
-                                total=file_size,
-                                unit='B',
-                                unit_scale=True,
-                                desc="    Computing SHA256",
-                                leave=False,
-                                bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'
-                            ) as hash_pbar:
-                                for chunk in iter(lambda: f.read(65536), b""):  # 64KB chunks for better performance
-                                    if chunk:
-                                        sha256_hash.update(chunk)
-                                        hash_pbar.update(len(chunk))
-                        
-                        local_sha256 = sha256_hash.hexdigest()
-                        
-                        if local_sha256 == expected_sha256:
-                            return "Verified", f"SHA256 ✓", False
-                        else:
-                            return "Checksum Fail", f"SHA256 mismatch", True
-            
-            except Exception:
-                pass  # Fall back to zero-byte analysis
-            
-            # Fallback to zero-byte analysis if checksum verification fails
-            # Sample from beginning, middle, and end
-            samples = []
-            sample_positions = [0, file_size//2, max(0, file_size - sample_size)]
-            
-            with open(file_path, 'rb') as f:
-                for pos in sample_positions:
-                    f.seek(pos)
-                    chunk = f.read(min(sample_size, file_size - pos))
-                    if chunk:
-                        samples.append(chunk)
-                
-                # Check for trailing zeros specifically
-                trailing_zeros = 0
-                f.seek(max(0, file_size - sample_size))
-                tail_chunk = f.read()
-                for byte in reversed(tail_chunk):
-                    if byte == 0:
-                        trailing_zeros += 1
-                    else:
-                        break
-            
-            # Calculate zero percentage from samples
-            total_sampled_bytes = sum(len(sample) for sample in samples)
-            zero_bytes = sum(sample.count(0) for sample in samples)
-            zero_percentage = (zero_bytes / total_sampled_bytes * 100) if total_sampled_bytes > 0 else 0
-            
-            # Convert trailing zeros to MB
-            trailing_zeros_mb = trailing_zeros / (1024 * 1024)
-            
-            # Flag as suspicious if:
-            # 1. More than 20% zeros (typical binary files have much less)
-            # 2. More than 10MB of trailing zeros
-            suspicious = zero_percentage > 20 or trailing_zeros_mb > 10
-            
-            if suspicious:
-                return "Suspicious", f"{zero_percentage:.1f}% zeros, {trailing_zeros_mb:.1f}MB trailing", True
-            else:
-                return "Size OK", f"{zero_percentage:.1f}% zeros", False
-            
-        except Exception as e:
-            return "Error", f"Check failed: {e}", False
-    
     # Parse repo_id to get organization and model name
     if '/' not in repo_id:
         raise ValueError("repo_id must be in format 'organization/model-name'")
@@ -412,72 +950,94 @@ def check_repository_status(repo_id, base_path=None):
     
     # Get list of files with sizes
     try:
-        repo_tree = list_repo_tree(repo_id, recursive=True)
+        repo_tree = _list_repo_tree_cached(repo_id, download_path)
         # Filter only files (not directories) - use more robust filtering
+        # Paths and sizes are collected alongside the items so later passes avoid attribute lookups
         file_items = []
+        file_paths = []
+        file_sizes = []
         for item in repo_tree:
-            # Check if it's a file by looking for size attribute or type
-            is_file = False
-            if hasattr(item, 'type'):
-                is_file = item.type == 'file'
-            elif hasattr(item, 'size') and getattr(item, 'size', None) is not None:
-                # If it has a size and size is not None, it's likely a file
-                is_file = True
-            else:
-                # Fallback: assume it's a file if path doesn't end with / and doesn't look like a directory
-                path_str = str(item.path)
-                is_file = not path_str.endswith('/') and '.' in path_str.split('/')[-1]
-            
-            if is_file:
+            if _is_file(item):
                 file_items.append(item)
+                file_paths.append(item.path)
+                file_sizes.append(getattr(item, 'size', None))
         
-        total_size = sum(getattr(item, 'size', 0) or 0 for item in file_items)
+        total_size = sum(size or 0 for size in file_sizes)
         print(f"\nFiles to download ({len(file_items)} total, {format_size(total_size)}):")
         print("-" * 120)
         print(f"{'#':>3} {'Status':<30} {'File':<40} {'Size':>10} {'Integrity':<25}")
         print("-" * 120)
         
         suspicious_files = []
+        unhashed_files = []
         missing_files = []
         incomplete_files = []
         
-        for i, item in enumerate(sorted(file_items, key=lambda x: x.path), 1):
-            local_file_path = download_path / item.path
-            expected_size = getattr(item, 'size', None)
-            
-            if local_file_path.exists():
-                if local_file_path.is_dir():
-                    # Skip directories - they shouldn't be in file_items but just in case
-                    continue
-                    
-                local_size = local_file_path.stat().st_size
-                
-                # Check file integrity for large files
+        local_stats = _stat_all([download_path / file_path for file_path in file_paths])
+        status_log = _StatusLog()
+        try:
+            order = sorted(range(len(file_items)), key=file_paths.__getitem__)
+            for i, index in enumerate(order, 1):
+                item = file_items[index]
+                expected_size = file_sizes[index]
+                local_file_path = download_path / item.path
+                local_stat = local_stats[index]
                 integrity_info = ""
-                if expected_size is not None:
-                    if local_size == expected_size:
-                        status = "✓ Complete"
-                        # Only check integrity for files larger than 10MB to avoid overhead
-                        if expected_size > 10 * 1024 * 1024:
-                            integrity_status, details, suspicious = check_file_integrity(local_file_path, repo_id, item.path)
-                            if suspicious:
-                                integrity_info = f"⚠ {details}"
-                                suspicious_files.append((item.path, integrity_status, details))
-                                status = f"⚠ {integrity_status}"
-                            else:
-                                integrity_info = f"✓ {details}"
+                
+                if local_stat is not None:
+                    if stat.S_ISDIR(local_stat.st_mode):
+                        # Skip directories - they shouldn't be in file_items but just in case
+                        continue
+                        
+                    local_size = local_stat.st_size
+                    
+                    # Check file integrity for large files
+                    if expected_size is not None:
+                        if local_size == expected_size:
+                            status = "✓ Complete"
+                            # Only check integrity for files larger than 10MB to avoid overhead
+                            if expected_size > 10 * 1024 * 1024:
+                                # Emit pending rows first so the hashing progress bar shows below them
+                                status_log.flush()
+                                integrity_status, details, suspicious = check_file_integrity(
+                                    local_file_path, _lfs_sha256(item),
+                                    meta_path=_meta_path(download_path, item.path), deep_check=deep_check
+                                )
+                                if suspicious:
+                                    integrity_info = f"⚠ {details}"
+                                    suspicious_files.append((item.path, integrity_status, details))
+                                    status = f"⚠ {integrity_status}"
+                                else:
+                                    integrity_info = f"✓ {details}"
+                                    if integrity_status == "Unchanged":
+                                        integrity_info = f"= {details}"
+                                        unhashed_files.append(item.path)
+                        else:
+                            status = f"⚠ Incomplete ({local_size}/{expected_size})"
+                            incomplete_files.append((item.path, local_size, expected_size))
                     else:
-                        status = f"⚠ Incomplete ({local_size}/{expected_size})"
-                        incomplete_files.append((item.path, local_size, expected_size))
+                        status = "? Unknown (no size info)"
+                        cached_etag = _read_etag(download_path, item.path)
+                        if cached_etag:
+                            # Conditional HEAD: 304 confirms the local copy matches the remote file
+                            try:
+                                file_url = f"https://huggingface.co/{repo_id}/resolve/main/{item.path}"
+                                head_response = SESSION.head(file_url, headers={'If-None-Match': cached_etag}, allow_redirects=True, timeout=10)
+                                if head_response.status_code == 304:
+                                    status = "✓ Unchanged (ETag)"
+                                elif head_response.status_code == 200:
+                                    status = "⚠ Changed (ETag)"
+                                    suspicious_files.append((item.path, "Changed", "remote ETag differs"))
+                            except Exception:
+                                pass
                 else:
-                    status = "? Unknown (no size info)"
-            else:
-                status = "○ Missing"
-                missing_files.append((item.path, expected_size))
-            
-            size_str = format_size(expected_size) if expected_size else "N/A"
-            print(f"  {i:2d}. {status:<30} {item.path:<40} {size_str:>10} {integrity_info:<25}")
-            
+                    status = "○ Missing"
+                    missing_files.append((item.path, expected_size))
+                
+                size_str = format_size(expected_size) if expected_size else "N/A"
+                status_log.write(f"  {i:2d}. {status:<30} {item.path:<40} {size_str:>10} {integrity_info:<25}")
+        finally:
+            status_log.flush()
         print("-" * 120)
         print(f"Total size: {format_size(total_size)}")
         
@@ -512,6 +1072,10 @@ def check_repository_status(repo_id, base_path=None):
                 print(f"\nTo re-download suspicious files, use:")
                 file_list = " ".join(f'"{f[0]}"' for f in suspicious_files)
                 print(f"  python3 download_hf_repo.py --force-files {file_list} {repo_id}")
+        elif unhashed_files:
+            print(f"\n✅ All files are complete; {len(unhashed_files)} unchanged since download were not re-hashed.")
+            print(f"To verify their SHA256 checksums, use:")
+            print(f"  python3 download_hf_repo.py --check --deep-check {repo_id}")
         else:
             print(f"\n✅ All files are complete and verified!")
             
@@ -557,12 +1121,32 @@ Examples:
         help="Force re-download specific files (provide relative paths from repo root)"
     )
     
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=8,
+        help="Number of files over 10 MB to download concurrently; smaller files use up to 4x as many workers (default: 8)"
+    )
+    
+    parser.add_argument(
+        "--backend",
+        choices=["requests", "hf_transfer"],
+        default="requests",
+        help="Download backend: built-in 'requests' downloader or 'hf_transfer' (requires: pip install hf_transfer)"
+    )
+    
     parser.add_argument(
         "--check", "-c",
         action="store_true",
         help="Check repository status and file integrity without downloading"
     )
     
+    parser.add_argument(
+        "--deep-check",
+        action="store_true",
+        help="With --check, compute SHA256 of every large file even if it is unchanged since download"
+    )
+    
     parser.add_argument(
         "--preview", "-p",
         action="store_true",
@@ -586,9 +1170,9 @@ Examples:
         if args.check or args.preview:
             if args.preview:
                 print("⚠️  Note: --preview is deprecated, use --check instead")
-            check_repository_status(args.repo_id, args.local_path)
+            check_repository_status(args.repo_id, args.local_path, args.deep_check)
         else:
-            download_path = download_hf_repo(args.repo_id, args.local_path, args.force, args.force_files)
+            download_path = download_hf_repo(args.repo_id, args.local_path, args.force, args.force_files, args.jobs, args.backend)
             if download_path:
                 print(f"\n✅ Download completed successfully!")
             else:
@@ -604,6 +1188,8 @@ Examples:
             import traceback
             traceback.print_exc()
         sys.exit(1)
+    finally:
+        SESSION.close()
 
 
 if __name__ == "__main__":